@@ -26,33 +26,68 @@ Controls:
 - Press 'ESC' to exit
 
 Usage:
-    python graph_score.py
+    python graph_score.py [--verbose]
 
 Requirements:
     - OpenCV (cv2)
     - numpy
     - python-osc
     - tkinter
+    - numba (optional, speeds up dynamic scanning)
 """
 
 import cv2
 import numpy as np
-from pythonosc import udp_client
+from pythonosc import udp_client, osc_bundle_builder, osc_message_builder
 import argparse
 import tkinter as tk
 from tkinter import ttk, filedialog
 from PIL import Image, ImageTk
 import os
+import time
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# numba is optional; without it the scan strip metrics run as plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 #todo 
 # add L loop functionality to play the score
 # add R to reverse scan
 
+# Print every OSC message sent while scanning (set with --verbose)
+VERBOSE = False
+
+# Key polling interval while idle (ms) and minimum time between scan redraws (s)
+IDLE_WAIT_MS = 15
+DISPLAY_INTERVAL = 1 / 60
+
+# Page images are kept PNG-encoded; only this many recently used pages stay decoded
+MAX_DECODED_PAGES = 3
+ANALYSIS_IMAGE_KEYS = ('keypoints_image', 'original_image')
+
+# Resolution factor the gray image is resized by before running SIFT (1.0 = full resolution)
+DETECT_SCALE = 0.5
+
+# Shared SIFT detector, created on first use and reused across analyses/scan steps
+_SIFT = None
+
+def get_sift():
+    global _SIFT
+    if _SIFT is None:
+        _SIFT = cv2.SIFT_create()
+    return _SIFT
+
 class ScoreManager:
     def __init__(self):
         self.scores = []  # List of (path, duration) tuples
         self.current_index = 0
-        self.analyzed_pages = {}  # Dictionary to store analyzed page data
+        self.analyzed_pages = {}  # Dictionary to store analyzed page data (images PNG-encoded)
+        self.decoded_pages = OrderedDict()  # LRU of recently used pages with decoded images
         self.auto_scanning = False  # Flag for auto-scanning mode
         
     def add_score(self, path, duration):
@@ -64,6 +99,7 @@ class ScoreManager:
             # Clean up analyzed data if it exists
             if index in self.analyzed_pages:
                 del self.analyzed_pages[index]
+            self.decoded_pages.pop(index, None)
             
     def get_current_score(self):
         if not self.scores:
@@ -73,40 +109,62 @@ class ScoreManager:
     def get_total_duration(self):
         return sum(duration for _, duration in self.scores)
     
-    def store_analysis(self, index, analysis_data):
+    def store_analysis(self, index, analysis_data, decoded_data=None):
+        # analysis_data holds PNG-encoded images (see encode_analysis); decoded_data is
+        # the same analysis with image arrays, kept decoded if the caller already has it
         self.analyzed_pages[index] = analysis_data
+        if decoded_data is not None:
+            self.remember_decoded(index, decoded_data)
+        else:
+            self.decoded_pages.pop(index, None)
     
     def get_analysis(self, index):
-        return self.analyzed_pages.get(index)
+        if index in self.decoded_pages:
+            self.decoded_pages.move_to_end(index)
+            return self.decoded_pages[index]
+        stored = self.analyzed_pages.get(index)
+        if stored is None:
+            return None
+        
+        # Decode the page images on demand
+        analysis_data = dict(stored)
+        for key in ANALYSIS_IMAGE_KEYS:
+            analysis_data[key] = cv2.imdecode(np.frombuffer(stored[key], np.uint8), cv2.IMREAD_COLOR)
+        self.remember_decoded(index, analysis_data)
+        return analysis_data
+    
+    def remember_decoded(self, index, analysis_data):
+        self.decoded_pages[index] = analysis_data
+        self.decoded_pages.move_to_end(index)
+        while len(self.decoded_pages) > MAX_DECODED_PAGES:
+            self.decoded_pages.popitem(last=False)
     
     def has_next_score(self):
         return len(self.scores) > 1 and self.current_index < len(self.scores) - 1
     
     def analyze_all_pages(self):
-        """Analyze all pages in the score set"""
-        for i in range(len(self.scores)):
-            path, _ = self.scores[i]
-            print(f"\nAnalyzing page {i + 1}/{len(self.scores)}: {os.path.basename(path)}")
-            
-            # Load and resize image
-            temp_image = cv2.resize(cv2.imread(path), (1424, 848))
-            temp_display = temp_image.copy()
-            
-            # Perform analysis
-            c, oc, _, p, _, _, _, _ = analyze_image(temp_image, temp_display)
-            
-            # Store analysis data
-            analysis_data = {
-                'keypoints_image': temp_display.copy(),
-                'contrast': c,
-                'object_count': oc,
-                'proximity': p,
-                'original_image': temp_image.copy()  # Store original image for scanning
-            }
-            self.store_analysis(i, analysis_data)
-            print(f"✓ Found {oc} objects")
+        """Analyze all pages in the score set, one worker process per page"""
+        paths = [path for path, _ in self.scores]
+        print(f"\nAnalyzing {len(paths)} pages...")
+        
+        if len(paths) > 1:
+            workers = min(os.cpu_count() or 1, len(paths))
+            # Spawn fresh workers: forking this process would copy a parent that
+            # already runs OpenCV, HighGUI and Tk threads
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_analysis_worker,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                self.store_page_results(paths, executor.map(analyze_path, paths))
+        else:
+            # A single page is not worth starting a worker process for
+            self.store_page_results(paths, map(analyze_path, paths))
         print("\nAnalysis complete! All pages are ready.")
     
+    def store_page_results(self, paths, results):
+        for i, analysis_data in enumerate(results):
+            self.store_analysis(i, analysis_data)
+            print(f"✓ Page {i + 1}/{len(paths)}: {os.path.basename(paths[i])} - "
+                  f"Found {analysis_data['object_count']} objects")
+    
     def next_score(self):
         if self.scores:
             self.current_index = (self.current_index + 1) % len(self.scores)
@@ -280,46 +338,142 @@ class ScoreGUI:
         cv2.destroyAllWindows()
         self.root.destroy()
 
-def analyze_image(image, display_image):
+def analyze_image(image, display_image, detect_scale=DETECT_SCALE):
     # Convert to grayscale
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return analyze_gray(gray, display_image, detect_scale)
+
+def analyze_gray(gray, display_image, detect_scale=DETECT_SCALE):
+    # Reuse the shared SIFT detector
+    sift = get_sift()
     
-    # Initialize SIFT detector
-    sift = cv2.SIFT_create()
-    
-    # Detect keypoints and compute descriptors
-    keypoints, descriptors = sift.detectAndCompute(gray, None)
+    # Detect keypoints and compute descriptors, on a downscaled copy if requested
+    if detect_scale != 1:
+        small = cv2.resize(gray, None, fx=detect_scale, fy=detect_scale, interpolation=cv2.INTER_AREA)
+        keypoints, descriptors = sift.detectAndCompute(small, None)
+        # Map keypoints back to full-resolution coordinates
+        for kp in keypoints:
+            kp.pt = (kp.pt[0] / detect_scale, kp.pt[1] / detect_scale)
+            kp.size /= detect_scale
+    else:
+        keypoints, descriptors = sift.detectAndCompute(gray, None)
     
-    # Draw keypoints on the display image with green and blue colors
-    for i, kp in enumerate(keypoints):
-        color = (0, 255, 0) if i % 2 == 0 else (0, 0, 0)  # Alternate between green and blue
-        cv2.drawKeypoints(display_image, [kp], display_image, color, flags=cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
+    # Draw keypoints on the display image, alternating green and black
+    # (one call per color instead of one call per keypoint)
+    cv2.drawKeypoints(display_image, keypoints[0::2], display_image, (0, 255, 0),
+                      flags=cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
+    cv2.drawKeypoints(display_image, keypoints[1::2], display_image, (0, 0, 0),
+                      flags=cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
     
     # Analyze keypoints
-    contrast = gray.std()
+    _, stddev = cv2.meanStdDev(gray)  # single pass over the uint8 image
+    contrast = float(stddev[0, 0])
     object_count = len(keypoints)
-    sizes = [kp.size for kp in keypoints]
+    
+    # Extract keypoint coordinates (Nx2 float32) and sizes in one go
+    if keypoints:
+        pts = cv2.KeyPoint_convert(keypoints)
+    else:
+        pts = np.empty((0, 2), dtype=np.float32)
+    sizes = np.array([kp.size for kp in keypoints], dtype=np.float32)
+    
+    # Keep keypoints ordered by x so scan strips can be looked up with a binary search
+    order = np.argsort(pts[:, 0], kind='stable')
+    pts = pts[order]
+    sizes = sizes[order]
     
     # Calculate size metrics
-    min_size = min(sizes) if sizes else 0
-    avg_size = np.mean(sizes) if sizes else 0
-    max_size = max(sizes) if sizes else 0
+    min_size = float(sizes.min()) if sizes.size else 0
+    avg_size = float(sizes.mean()) if sizes.size else 0
+    max_size = float(sizes.max()) if sizes.size else 0
     
     # Calculate proximity as the average distance of keypoints from the center
     center_x, center_y = gray.shape[1] // 2, gray.shape[0] // 2
-    proximity = np.mean([np.sqrt((kp.pt[0] - center_x) ** 2 + (kp.pt[1] - center_y) ** 2) for kp in keypoints])
+    proximity = np.hypot(pts[:, 0] - center_x, pts[:, 1] - center_y).mean()
     
     # Calculate positions for OSC transmission
-    positions = [(kp.pt[0] / gray.shape[1], kp.pt[1] / gray.shape[0]) for kp in keypoints]
+    positions = pts / np.array([gray.shape[1], gray.shape[0]], dtype=np.float32)
+    
+    # Keypoint columns in pixels, sorted ascending, for strip_metrics
+    keypoint_x = pts[:, 0]
+    
+    return contrast, object_count, sizes, proximity, min_size, avg_size, max_size, positions, keypoint_x
+
+def _strip_metrics(keypoint_x, keypoint_sizes, start_x, end_x):
+    lo = np.searchsorted(keypoint_x, start_x)
+    hi = np.searchsorted(keypoint_x, end_x)
+    if hi == lo:
+        return 0, 0.0, 0.0, 0.0
+    sizes = keypoint_sizes[lo:hi]
+    return hi - lo, float(sizes.min()), float(sizes.mean()), float(sizes.max())
+
+# Compile the per-step kernel when numba is available. The explicit signature
+# (float32 keypoint arrays, integer column bounds) compiles it at import time
+# rather than stalling the first scan step
+if njit is not None:
+    _strip_metrics = njit("Tuple((int64, float64, float64, float64))(float32[:], float32[:], int64, int64)",
+                          cache=True)(_strip_metrics)
+
+def strip_metrics(keypoint_x, keypoint_sizes, start_x, end_x):
+    # Count and size metrics of the page keypoints falling in columns [start_x, end_x)
+    # keypoint_x must be sorted ascending (as returned by analyze_gray)
+    count, min_size, avg_size, max_size = _strip_metrics(keypoint_x, keypoint_sizes, start_x, end_x)
+    if not count:
+        return 0, 0, 0, 0
+    return int(count), float(min_size), float(avg_size), float(max_size)
+
+def send_scan_bundle(client, scan_object_count, min_size, avg_size, max_size):
+    # Send the four scan metrics as a single OSC bundle (one UDP datagram)
+    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+    for address, value in (("/image/scan_object_count", scan_object_count),
+                           ("/image/scan_min_size", min_size),
+                           ("/image/scan_avg_size", avg_size),
+                           ("/image/scan_max_size", max_size)):
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        msg.add_arg(value)
+        bundle.add_content(msg.build())
+    client.send(bundle.build())
+
+def init_analysis_worker():
+    # One OpenCV thread per worker process; the pool already uses every core
+    cv2.setNumThreads(1)
+
+def analyze_path(path):
+    # Load, resize and analyze one page; top-level so ProcessPoolExecutor can pickle it
+    image = cv2.resize(cv2.imread(path), (1424, 848))
+    display = image.copy()
+    
+    c, oc, sizes, p, _, _, _, _, keypoint_x = analyze_image(image, display)
     
-    return contrast, object_count, sizes, proximity, min_size, avg_size, max_size, positions
+    # Encode in the worker so the pool returns compact bytes
+    return encode_analysis({
+        'keypoints_image': display,
+        'contrast': c,
+        'object_count': oc,
+        'proximity': p,
+        'original_image': image,  # Store original image for scanning
+        'keypoint_x': keypoint_x,  # Keypoint columns for scanning
+        'keypoint_sizes': sizes
+    })
+
+def encode_analysis(analysis_data):
+    # Copy of the analysis with its page images PNG-encoded for ScoreManager.store_analysis
+    encoded = dict(analysis_data)
+    for key in ANALYSIS_IMAGE_KEYS:
+        encoded[key] = cv2.imencode('.png', analysis_data[key])[1].tobytes()
+    return encoded
+
+# Info box overlay, kept between calls so only rows whose text changed are re-rendered
+INFO_BOX_SIZE = 140
+INFO_ROW_HEIGHT = 20
+_info_overlay = np.zeros((INFO_BOX_SIZE, INFO_BOX_SIZE, 3), dtype=np.uint8)
+_info_texts = {}
 
-def add_info_box(image, contrast, object_count, proximity, duration, current_page=0, total_pages=1, total_duration=None, scan_data=None, scan_object_count=None):
-    # Create a black rectangle in the lower right corner
+def add_info_box(image, contrast, object_count, proximity, duration, current_page=0, total_pages=1, total_duration=None, scan_area=None, scan_object_count=None):
+    # Black box in the lower right corner
     h, w = image.shape[:2]
-    start_x = w - 140  # 140 pixels from right
-    start_y = h - 140  # Increased height for additional info
-    image[start_y:h, start_x:w] = (0, 0, 0)  # Black rectangle
+    start_x = w - INFO_BOX_SIZE  # 140 pixels from right
+    start_y = h - INFO_BOX_SIZE  # Increased height for additional info
     
     # Add text with white color
     font = cv2.FONT_HERSHEY_SIMPLEX
@@ -332,12 +486,10 @@ def add_info_box(image, contrast, object_count, proximity, duration, current_pag
     total_pages = 1 if total_pages is None else total_pages
     total_duration = duration if total_duration is None else total_duration
     
-    if scan_data is not None:
-        # Calculate metrics for the scanned area
-        scan_array = np.array(scan_data)
-        scan_mean = np.mean(scan_array)
-        scan_std = np.std(scan_array)
-        scan_max = np.max(scan_array)
+    if scan_area is not None:
+        # Approximate mean intensity of the scanned area from every 4th row/column;
+        # it is only displayed, so the sampled estimate is close enough
+        scan_mean = float(scan_area[::4, ::4].mean())
         
         texts = [
             f"Page: {current_page + 1}/{total_pages}",
@@ -357,210 +509,286 @@ def add_info_box(image, contrast, object_count, proximity, duration, current_pag
             f"Proximity: {proximity:.1f}"
         ]
     
-    # Position and draw each line of text
+    # Re-render only the rows whose text changed; each row owns a 20px band
+    # of the overlay with its baseline at the same place as before
     for i, text in enumerate(texts):
-        y_position = start_y + 20 + (i * 20)
-        cv2.putText(image, text, (start_x + 5, y_position), 
-                   font, font_scale, color, thickness)
+        if _info_texts.get(i) != text:
+            band_top = 4 + i * INFO_ROW_HEIGHT
+            band = _info_overlay[band_top:band_top + INFO_ROW_HEIGHT]
+            band[:] = 0
+            cv2.putText(band, text, (5, INFO_ROW_HEIGHT - 4),
+                       font, font_scale, color, thickness)
+            _info_texts[i] = text
+    
+    # Blit the overlay onto the image
+    image[start_y:h, start_x:w] = _info_overlay
 
 def main(image_path, duration, score_manager=None, auto_play=False):
-    # Load image
-    image = cv2.imread(image_path)
-    if image is None:
-        print(f"Error: Could not load image {image_path}")
-        return
-    
-    # Resize image to 1424 x 848
-    image = cv2.resize(image, (1424, 848))
-    display_image = image.copy()
     client = udp_client.SimpleUDPClient("127.0.0.1", 8000)
     
-    # Initialize scanning direction and position
-    reverse_scan = False
-    current_position = 0
-    keypoints_image = None
-    
-    # Get page information
-    if score_manager:
-        current_page = score_manager.current_index
-        total_pages = len(score_manager.scores)
-        total_duration = score_manager.get_total_duration()
-        
-        # Load existing analysis if available
-        existing_analysis = score_manager.get_analysis(current_page)
+    # One iteration per page; page changes update image_path/duration and loop
+    # instead of recursing into main()
+    while True:
+        # Reuse the already resized page from a previous analysis when available
+        existing_analysis = score_manager.get_analysis(score_manager.current_index) if score_manager else None
         if existing_analysis:
-            keypoints_image = existing_analysis['keypoints_image'].copy()
-            image = existing_analysis['original_image'].copy()
-            contrast = existing_analysis['contrast']
-            object_count = existing_analysis['object_count']
-            proximity = existing_analysis['proximity']
-            display_image = keypoints_image.copy()
+            image = existing_analysis['original_image']
         else:
-            # Perform initial analysis if not available
-            contrast, object_count, _, proximity, _, _, _, _ = analyze_image(image, display_image)
-            keypoints_image = display_image.copy()
-    else:
-        current_page = 0
-        total_pages = 1
-        total_duration = duration
-        contrast, object_count, _, proximity, _, _, _, _ = analyze_image(image, display_image)
-        keypoints_image = display_image.copy()
-    
-    # Store analysis data if not already stored
-    if score_manager and score_manager.get_analysis(current_page) is None:
-        analysis_data = {
-            'keypoints_image': keypoints_image.copy(),
-            'original_image': image.copy(),
-            'contrast': contrast,
-            'object_count': object_count,
-            'proximity': proximity
-        }
-        score_manager.store_analysis(current_page, analysis_data)
-    
-    start_time = cv2.getTickCount()
-    page_duration = duration * 1000  # Convert to milliseconds
-    
-    while True:
-        # Use analyzed image if available
-        if keypoints_image is not None:
-            display_image = keypoints_image.copy()
+            # Load image
+            image = cv2.imread(image_path)
+            if image is None:
+                print(f"Error: Could not load image {image_path}")
+                break
             
-        add_info_box(display_image, contrast, object_count, proximity, duration,
-                    current_page, total_pages, total_duration)
+            # Resize image to 1424 x 848
+            image = cv2.resize(image, (1424, 848))
+        display_image = image.copy()
+        
+        # Initialize scanning direction and position
+        reverse_scan = False
+        current_position = 0
+        keypoints_image = None
+        
+        # Get page information
+        if score_manager:
+            current_page = score_manager.current_index
+            total_pages = len(score_manager.scores)
+            total_duration = score_manager.get_total_duration()
+            
+            # Load existing analysis if available
+            if existing_analysis:
+                keypoints_image = existing_analysis['keypoints_image']
+                contrast = existing_analysis['contrast']
+                object_count = existing_analysis['object_count']
+                proximity = existing_analysis['proximity']
+                keypoint_x = existing_analysis['keypoint_x']
+                keypoint_sizes = existing_analysis['keypoint_sizes']
+                display_image = keypoints_image.copy()
+            else:
+                # Perform initial analysis if not available
+                contrast, object_count, keypoint_sizes, proximity, _, _, _, _, keypoint_x = analyze_image(image, display_image)
+                keypoints_image = display_image.copy()
+        else:
+            current_page = 0
+            total_pages = 1
+            total_duration = duration
+            contrast, object_count, keypoint_sizes, proximity, _, _, _, _, keypoint_x = analyze_image(image, display_image)
+            keypoints_image = display_image.copy()
         
-        cv2.imshow("Image with Analysis", display_image)
-        key = cv2.waitKey(1) & 0xFF
+        # Store analysis data if not already stored
+        if score_manager and score_manager.get_analysis(current_page) is None:
+            analysis_data = {
+                'keypoints_image': keypoints_image,
+                'original_image': image,
+                'contrast': contrast,
+                'object_count': object_count,
+                'proximity': proximity,
+                'keypoint_x': keypoint_x,
+                'keypoint_sizes': keypoint_sizes
+            }
+            score_manager.store_analysis(current_page, encode_analysis(analysis_data), analysis_data)
         
-        if key == ord('a'):
-            if score_manager:
-                print("\nStarting analysis of all pages...")
-                score_manager.analyze_all_pages()
-                
-                # Update current page analysis after analyzing all
-                existing_analysis = score_manager.get_analysis(current_page)
-                if existing_analysis:
-                    keypoints_image = existing_analysis['keypoints_image'].copy()
-                    image = existing_analysis['original_image'].copy()
-                    contrast = existing_analysis['contrast']
-                    object_count = existing_analysis['object_count']
-                    proximity = existing_analysis['proximity']
+        start_time = cv2.getTickCount()
+        page_duration = duration * 1000  # Convert to milliseconds
+        
+        # Only rebuild the display image when the page or its analysis changed
+        needs_redraw = True
+        change_page = False
+        
+        while True:
+            if needs_redraw:
+                # Use analyzed image if available
+                if keypoints_image is not None:
                     display_image = keypoints_image.copy()
                     
+                add_info_box(display_image, contrast, object_count, proximity, duration,
+                            current_page, total_pages, total_duration)
+                cv2.imshow("Image with Analysis", display_image)
+                needs_redraw = False
+            
+            key = cv2.waitKey(IDLE_WAIT_MS) & 0xFF
+            
+            # The view is only re-shown when it changes, so a window closed with its
+            # close button would never come back; treat that like ESC
+            if cv2.getWindowProperty("Image with Analysis", cv2.WND_PROP_VISIBLE) < 1:
+                key = 27
+            
+            if key == ord('a'):
+                if score_manager:
+                    print("\nStarting analysis of all pages...")
+                    score_manager.analyze_all_pages()
+                    
+                    # Update current page analysis after analyzing all
+                    existing_analysis = score_manager.get_analysis(current_page)
+                    if existing_analysis:
+                        keypoints_image = existing_analysis['keypoints_image']
+                        image = existing_analysis['original_image']
+                        contrast = existing_analysis['contrast']
+                        object_count = existing_analysis['object_count']
+                        proximity = existing_analysis['proximity']
+                        keypoint_x = existing_analysis['keypoint_x']
+                        keypoint_sizes = existing_analysis['keypoint_sizes']
+                        
+                        # Send only the object count as an OSC message
+                        client.send_message("/image/object_count", object_count)
+                        print(f"Sent OSC: /image/object_count {object_count}")
+                else:
+                    # Single page analysis
+                    display_image = image.copy()
+                    contrast, object_count, keypoint_sizes, proximity, min_size, avg_size, max_size, positions, keypoint_x = analyze_image(image, display_image)
+                    keypoints_image = display_image.copy()
+                    
                     # Send only the object count as an OSC message
                     client.send_message("/image/object_count", object_count)
                     print(f"Sent OSC: /image/object_count {object_count}")
-                    
-                    # Show updated analysis
-                    add_info_box(display_image, contrast, object_count, proximity, duration,
-                               current_page, total_pages, total_duration)
-                    cv2.imshow("Image with Analysis", display_image)
-            else:
-                # Single page analysis
-                display_image = image.copy()
-                contrast, object_count, sizes, proximity, min_size, avg_size, max_size, positions = analyze_image(image, display_image)
-                keypoints_image = display_image.copy()
                 
-                # Send only the object count as an OSC message
-                client.send_message("/image/object_count", object_count)
-                print(f"Sent OSC: /image/object_count {object_count}")
+                print(f"Current page has {object_count} objects")
+                needs_redraw = True
             
-            print(f"Current page has {object_count} objects")
-        
-        elif key == ord('n') and score_manager:
-            path, duration = score_manager.next_score()
-            if path:
-                return main(path, duration, score_manager, auto_play)
-        
-        elif key == ord('p') and score_manager:
-            path, duration = score_manager.previous_score()
-            if path:
-                return main(path, duration, score_manager, auto_play)
-        
-        elif key == ord('b'):
-            # Ensure we have analysis before scanning
-            if keypoints_image is None:
-                if score_manager and score_manager.get_analysis(current_page):
-                    analysis = score_manager.get_analysis(current_page)
-                    keypoints_image = analysis['keypoints_image'].copy()
-                    contrast = analysis['contrast']
-                    object_count = analysis['object_count']
-                    proximity = analysis['proximity']
-                else:
-                    keypoints_image = image.copy()
-                    contrast, object_count, sizes, proximity, min_size, avg_size, max_size, positions = analyze_image(image, keypoints_image)
+            elif key == ord('n') and score_manager:
+                path, duration = score_manager.next_score()
+                if path:
+                    image_path = path
+                    change_page = True
+                    break
             
-            scanning = True
-            while scanning:
-                # Perform scanning for current page
-                scan_width = 60
-                scan_height = 848
-                num_steps = (image.shape[1] - scan_width) + 1
-                step_duration = duration / num_steps
-                
-                current_position = 0 if not reverse_scan else num_steps - 1
+            elif key == ord('p') and score_manager:
+                path, duration = score_manager.previous_score()
+                if path:
+                    image_path = path
+                    change_page = True
+                    break
+            
+            elif key == ord('b'):
+                # Ensure we have analysis before scanning
+                if keypoints_image is None:
+                    if score_manager and score_manager.get_analysis(current_page):
+                        analysis = score_manager.get_analysis(current_page)
+                        keypoints_image = analysis['keypoints_image'].copy()
+                        contrast = analysis['contrast']
+                        object_count = analysis['object_count']
+                        proximity = analysis['proximity']
+                        keypoint_x = analysis['keypoint_x']
+                        keypoint_sizes = analysis['keypoint_sizes']
+                    else:
+                        keypoints_image = image.copy()
+                        contrast, object_count, keypoint_sizes, proximity, min_size, avg_size, max_size, positions, keypoint_x = analyze_image(image, keypoints_image)
                 
-                while scanning and 0 <= current_position < num_steps:
-                    key = cv2.waitKey(int(step_duration * 1000)) & 0xFF
-                    
-                    if key == ord('r'):
-                        reverse_scan = True
-                    elif key == ord('f'):
-                        reverse_scan = False
-                    elif key == 27:  # ESC key
-                        scanning = False
-                        break
-                    
-                    start_x = current_position
-                    end_x = start_x + scan_width
+                scanning = True
+                while scanning:
+                    # Perform scanning for current page
+                    scan_width = 60
+                    scan_height = 848
+                    num_steps = (image.shape[1] - scan_width) + 1
+                    step_duration = duration / num_steps
                     
-                    display_image = keypoints_image.copy()
-                    scan_area = display_image[:, start_x:end_x].copy()
-                    scan_area = cv2.bitwise_not(scan_area)
-                    
-                    _, scan_object_count, scan_sizes, _, min_size, avg_size, max_size, positions = analyze_image(
-                        image[:, start_x:end_x], scan_area)
-                    
-                    display_image[:, start_x:end_x] = scan_area
-                    cv2.rectangle(display_image, (start_x, 0), (end_x, scan_height), (0, 255, 0), 2)
+                    current_position = 0 if not reverse_scan else num_steps - 1
                     
-                    # Send OSC messages for dynamic scanning
-                    client.send_message("/image/scan_object_count", scan_object_count)
-                    client.send_message("/image/scan_min_size", min_size)
-                    client.send_message("/image/scan_avg_size", avg_size)
-                    client.send_message("/image/scan_max_size", max_size)
+                    # Buffers reused by every scan step instead of allocating new copies
+                    scan_display = np.empty_like(keypoints_image)
+                    scan_buf = np.empty((scan_height, scan_width, 3), dtype=np.uint8)
                     
-                    # Print OSC messages
-                    print(f"Sent OSC: /image/scan_object_count {scan_object_count}")
-                    print(f"Sent OSC: /image/scan_min_size {min_size}")
-                    print(f"Sent OSC: /image/scan_avg_size {avg_size}")
-                    print(f"Sent OSC: /image/scan_max_size {max_size}")
+                    # Steps follow a fixed schedule; the display is redrawn at most
+                    # every DISPLAY_INTERVAL however fast the steps are
+                    next_step_time = time.monotonic()
+                    last_draw_time = 0.0
                     
-                    add_info_box(display_image, contrast, object_count, proximity, duration,
-                               current_page, total_pages, total_duration,
-                               scan_data=scan_area.flatten(), scan_object_count=scan_object_count)
+                    # Scan metrics last sent over OSC; unchanged values are not resent
+                    last_sent = None
                     
-                    cv2.imshow("Image with Analysis", display_image)
+                    while scanning and 0 <= current_position < num_steps:
+                        # Wait for the next step while polling keys. Overdue steps run back
+                        # to back to catch up, polling keys only once per display frame
+                        wait_ms = int((next_step_time - time.monotonic()) * 1000)
+                        if wait_ms > 0:
+                            key = cv2.waitKey(wait_ms) & 0xFF
+                        elif time.monotonic() - last_draw_time >= DISPLAY_INTERVAL:
+                            key = cv2.waitKey(1) & 0xFF
+                        else:
+                            key = 0xFF
+                        next_step_time += step_duration
+                        
+                        if key == ord('r'):
+                            reverse_scan = True
+                        elif key == ord('f'):
+                            reverse_scan = False
+                        elif key == 27:  # ESC key
+                            scanning = False
+                            break
+                        
+                        start_x = current_position
+                        end_x = start_x + scan_width
+                        
+                        # Reuse the page keypoints instead of re-running SIFT on the strip
+                        scan_object_count, min_size, avg_size, max_size = strip_metrics(
+                            keypoint_x, keypoint_sizes, start_x, end_x)
+                        
+                        # Send OSC messages for dynamic scanning, only when the metrics changed
+                        scan_metrics = (scan_object_count, min_size, avg_size, max_size)
+                        if scan_metrics != last_sent:
+                            send_scan_bundle(client, *scan_metrics)
+                            last_sent = scan_metrics
+                            
+                            # Print OSC messages
+                            if VERBOSE:
+                                print(f"Sent OSC: /image/scan_object_count {scan_object_count}")
+                                print(f"Sent OSC: /image/scan_min_size {min_size}")
+                                print(f"Sent OSC: /image/scan_avg_size {avg_size}")
+                                print(f"Sent OSC: /image/scan_max_size {max_size}")
+                        
+                        # Always draw the final step so the sweep visibly reaches the page edge
+                        last_step = current_position == (0 if reverse_scan else num_steps - 1)
+                        now = time.monotonic()
+                        if last_step or now - last_draw_time >= DISPLAY_INTERVAL:
+                            display_image = scan_display
+                            np.copyto(display_image, keypoints_image)
+                            scan_area = scan_buf
+                            np.copyto(scan_area, display_image[:, start_x:end_x])
+                            cv2.bitwise_not(scan_area, dst=scan_area)
+                            
+                            display_image[:, start_x:end_x] = scan_area
+                            cv2.rectangle(display_image, (start_x, 0), (end_x, scan_height), (0, 255, 0), 2)
+                            
+                            add_info_box(display_image, contrast, object_count, proximity, duration,
+                                       current_page, total_pages, total_duration,
+                                       scan_area=scan_area, scan_object_count=scan_object_count)
+                            
+                            cv2.imshow("Image with Analysis", display_image)
+                            last_draw_time = now
+                        
+                        if reverse_scan:
+                            current_position -= 1
+                        else:
+                            current_position += 1
                     
-                    if reverse_scan:
-                        current_position -= 1
-                    else:
-                        current_position += 1
-                
-                # Check if we should move to next page
-                if scanning and score_manager and score_manager.has_next_score():
-                    path, duration = score_manager.next_score()
-                    if path:
-                        print(f"Moving to next page: {score_manager.current_index + 1}/{total_pages}")
-                        return main(path, duration, score_manager, auto_play)
-                else:
+                    # Check if we should move to next page
+                    if scanning and score_manager and score_manager.has_next_score():
+                        path, duration = score_manager.next_score()
+                        if path:
+                            print(f"Moving to next page: {score_manager.current_index + 1}/{total_pages}")
+                            image_path = path
+                            change_page = True
                     scanning = False
+                
+                if change_page:
+                    break
+                
+                # Restore the static view after the scan
+                needs_redraw = True
+            
+            elif key == 27:  # ESC key to exit
+                break
         
-        elif key == 27:  # ESC key to exit
+        if not change_page:
             break
     
     cv2.destroyAllWindows()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Graphic Score Analyzer and OSC Transmitter")
+    parser.add_argument("--verbose", action="store_true", help="print every OSC message sent while scanning")
+    VERBOSE = parser.parse_args().verbose
+    
     root = tk.Tk()
     app = ScoreGUI(root)
     root.mainloop()
\ No newline at end of file